@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Analysis and Drafting Agents
+This script times every agent operation over a generated corpus of synthetic
+contracts and compares the results against a stored baseline.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from app.services.ai_agents import AIAgentService
+from app.services.enhanced_drafting_agent import EnhancedDraftingAgent
+
+DEFAULT_SIZES = ['1KB', '10KB', '100KB', '1MB', '5MB']
+# Below this many samples nearest-rank p95 is just the slowest run
+MIN_P95_SAMPLES = 20
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(SCRIPT_DIR, 'benchmark_baseline.json')
+BACKEND_DIR = os.path.join(SCRIPT_DIR, 'backend')
+MEMORY_METRICS = ['peak_alloc_kb', 'peak_rss_growth_kb']
+COLD_START_PREFIX = 'cold_start@'
+
+# Runs in a fresh interpreter so module imports and agent construction are truly cold
+COLD_START_SCRIPT = """
+import json, sys, time
+sys.path.append(sys.argv[1])
+timings = {}
+start = time.perf_counter()
+from app.services.ai_agents import AIAgentService
+timings['import_ai_agents'] = time.perf_counter() - start
+start = time.perf_counter()
+AIAgentService()
+timings['construct_ai_agent_service'] = time.perf_counter() - start
+start = time.perf_counter()
+from app.services.enhanced_drafting_agent import EnhancedDraftingAgent
+timings['import_enhanced_drafting_agent'] = time.perf_counter() - start
+start = time.perf_counter()
+EnhancedDraftingAgent()
+timings['construct_enhanced_drafting_agent'] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+# Runs one operation in a fresh interpreter and reports how far VmHWM rose above the
+# resident size after setup, so interpreter start, backend import, agent construction
+# and reading the corpus are excluded. ru_maxrss is not usable here: on Linux a
+# fork+exec child inherits the parent's peak.
+RSS_PROBE_SCRIPT = """
+import asyncio, json, sys
+sys.path.insert(0, sys.argv[1])
+import benchmark_agents as bench
+
+def status_kb(field):
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field + ':'):
+                return int(line.split()[1])
+
+name, file_path = sys.argv[2], sys.argv[3]
+drafting_agent = bench.EnhancedDraftingAgent()
+if name == 'draft_legal_document':
+    operation = bench.draft_operation(drafting_agent)
+else:
+    with open(file_path) as f:
+        content = f.read()
+    operation = bench.build_operations(bench.AIAgentService(), drafting_agent, file_path, content)[name]
+
+try:
+    # Writing 5 resets VmHWM to the current RSS (Linux 4.0+)
+    with open('/proc/self/clear_refs', 'w') as f:
+        f.write('5')
+    before = status_kb('VmRSS')
+except OSError:
+    # Without the reset only growth above the setup peak is visible
+    before = status_kb('VmHWM')
+asyncio.run(operation())
+print(json.dumps({'before': before, 'after': status_kb('VmHWM')}))
+"""
+
+CLAUSE_PARAGRAPHS = [
+    """{n}. SERVICES
+    Contractor shall provide software development, code review and technical
+    documentation services as described in each statement of work.""",
+
+    """{n}. PAYMENT TERMS
+    Client shall pay $5,000 per month, net 15 days. Late payments accrue
+    interest at 1.5% per month.""",
+
+    """{n}. CONFIDENTIALITY
+    Each party agrees to maintain the confidentiality of the other party's
+    proprietary information and trade secrets during and after this agreement.""",
+
+    """{n}. INTELLECTUAL PROPERTY
+    All inventions, patents, copyrights and work product created under this
+    agreement shall be owned exclusively by Client.""",
+
+    """{n}. LIMITATION OF LIABILITY
+    Notwithstanding anything to the contrary, neither party shall be liable for
+    indirect or consequential damages. Contractor shall indemnify Client against
+    third-party claims arising from a breach hereof.""",
+
+    """{n}. TERMINATION
+    Either party may terminate this agreement with 30 days written notice.
+    Client may terminate immediately for cause including misconduct or breach.""",
+
+    """{n}. GOVERNING LAW
+    This agreement shall be governed by the laws of California and any disputes
+    shall be resolved through binding arbitration.""",
+]
+
+DRAFT_REQUEST = {
+    'document_type': 'service_agreement',
+    'parties': {
+        'party1': 'TechCorp Inc.',
+        'party2': 'Jane Smith Consulting'
+    },
+    'terms': {
+        'service_description': 'Web development and design services',
+        'total_fee': '$10,000',
+        'payment_schedule': 'Monthly payments of $2,500'
+    },
+    'jurisdiction': 'California',
+    'special_instructions': 'Include intellectual property clause'
+}
+
+
+def parse_size(label):
+    """Turn a size label such as '100KB' or '5MB' into a byte count"""
+    units = {'KB': 1024, 'MB': 1024 * 1024}
+    label = label.strip().upper()
+    for suffix, factor in units.items():
+        if label.endswith(suffix):
+            return int(float(label[:-len(suffix)]) * factor)
+    return int(label)
+
+
+def generate_contract(target_bytes, seed=0):
+    """Build a synthetic service agreement of roughly target_bytes"""
+    rng = random.Random(seed)
+    parts = [
+        "SERVICE AGREEMENT\n\n"
+        "This Service Agreement is entered into on March 15, 2024 between "
+        "ABC Consulting LLC (\"Contractor\") and XYZ Corporation (\"Client\").\n"
+    ]
+    size = len(parts[0])
+    n = 1
+    while size < target_bytes:
+        paragraph = rng.choice(CLAUSE_PARAGRAPHS).format(n=n) + "\n\n"
+        parts.append(paragraph)
+        size += len(paragraph)
+        n += 1
+    return ''.join(parts)[:target_bytes]
+
+
+def non_negative_int(value):
+    """argparse type for counts where 0 means skip"""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {value}")
+    return number
+
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+async def measure(operation, iterations):
+    """Run an async operation several times, recording latency and peak memory"""
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await operation()
+        latencies.append(time.perf_counter() - start)
+
+    # Allocations are traced on a separate run so tracing overhead stays out of the timings
+    tracemalloc.start()
+    await operation()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    total = sum(latencies)
+    stats = latency_stats(latencies)
+    stats['docs_per_sec'] = iterations / total if total else 0.0
+    stats['peak_alloc_kb'] = peak_bytes / 1024
+    return stats
+
+
+def latency_stats(latencies):
+    """Latency percentiles in milliseconds for a list of timings in seconds"""
+    return {
+        'iterations': len(latencies),
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+    }
+
+
+def measure_cold_start(runs):
+    """Time import and construction of both agents in fresh interpreters"""
+    samples = {}
+    for _ in range(runs):
+        for stage, seconds in run_in_fresh_interpreter(COLD_START_SCRIPT, BACKEND_DIR).items():
+            samples.setdefault(stage, []).append(seconds)
+
+    print("\n🧊 Cold Start")
+    print("-" * 50)
+    results = {}
+    for stage, latencies in samples.items():
+        stats = latency_stats(latencies)
+        results[f'{COLD_START_PREFIX}{stage}'] = stats
+        print(f"   • {stage:<34} p50 {stats['p50_ms']:9.2f} ms | p95 {stats['p95_ms']:9.2f} ms")
+
+    total = latency_stats([sum(run) for run in zip(*samples.values())])
+    results[f'{COLD_START_PREFIX}total'] = total
+    print(f"   • {'total':<34} p50 {total['p50_ms']:9.2f} ms | p95 {total['p95_ms']:9.2f} ms")
+    return results
+
+
+def run_in_fresh_interpreter(script, *args):
+    """Run a snippet in a new Python process and return the JSON it prints last"""
+    try:
+        output = subprocess.run(
+            [sys.executable, '-c', script, *args],
+            capture_output=True, text=True, check=True
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        print(f"\n❌ Benchmark subprocess failed (exit code {e.returncode}):")
+        print(e.stderr)
+        sys.exit(2)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure_peak_rss_growth(name, file_path=''):
+    """Peak RSS growth in KB while one operation runs in a fresh interpreter, or None if unsupported
+
+    Unlike tracemalloc this includes native allocations, e.g. PDF/DOCX parser buffers.
+    It needs /proc/self/status, so it is only reported on Linux.
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    usage = run_in_fresh_interpreter(RSS_PROBE_SCRIPT, SCRIPT_DIR, name, file_path)
+    return float(max(usage['after'] - usage['before'], 0))
+
+
+def process_peak_rss_kb():
+    """Peak resident set size of this process, where the platform reports it"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak / 1024 if sys.platform == 'darwin' else float(peak)
+
+
+def build_operations(ai_agent, drafting_agent, file_path, content):
+    """Per-document operations, keyed by the name used in results"""
+    return {
+        'extract_clauses': lambda: ai_agent.extract_clauses(file_path, {}),
+        'detect_risks': lambda: ai_agent.detect_risks(file_path, {}),
+        'summarize_document': lambda: ai_agent.summarize_document(file_path, {}),
+        'suggest_missing_clauses': lambda: drafting_agent.suggest_missing_clauses(content, 'service_agreement'),
+        'check_document_completeness': lambda: drafting_agent.check_document_completeness(content, 'service_agreement'),
+        'explain_legal_terms': lambda: drafting_agent.explain_legal_terms(content),
+    }
+
+
+def draft_operation(drafting_agent):
+    return lambda: drafting_agent.draft_legal_document(DRAFT_REQUEST)
+
+
+async def run_benchmarks(sizes, iterations):
+    """Benchmark every agent operation over the synthetic corpus"""
+    ai_agent = AIAgentService()
+    drafting_agent = EnhancedDraftingAgent()
+
+    results = {}
+    corpus_dir = tempfile.mkdtemp(prefix='legal_bench_')
+    try:
+        for label in sizes:
+            content = generate_contract(parse_size(label))
+            file_path = os.path.join(corpus_dir, f'contract_{label}.txt')
+            with open(file_path, 'w') as f:
+                f.write(content)
+
+            print(f"\n📄 Corpus size: {label} ({len(content):,} bytes)")
+            print("-" * 50)
+
+            operations = build_operations(ai_agent, drafting_agent, file_path, content)
+            for name, operation in operations.items():
+                stats = await measure(operation, iterations)
+                stats['peak_rss_growth_kb'] = measure_peak_rss_growth(name, file_path)
+                results[f'{name}@{label}'] = stats
+                print_stats(name, stats)
+
+        print("\n✍️  Drafting")
+        print("-" * 50)
+        stats = await measure(draft_operation(drafting_agent), iterations)
+        stats['peak_rss_growth_kb'] = measure_peak_rss_growth('draft_legal_document')
+        results['draft_legal_document'] = stats
+        print_stats('draft_legal_document', stats)
+    finally:
+        shutil.rmtree(corpus_dir, ignore_errors=True)
+
+    return results
+
+
+def print_stats(name, stats):
+    rss = f"+{stats['peak_rss_growth_kb'] / 1024:6.1f} MB" if stats.get('peak_rss_growth_kb') is not None else '    n/a   '
+    print(f"   • {name:<28} p50 {stats['p50_ms']:9.2f} ms | "
+          f"p95 {stats['p95_ms']:9.2f} ms | p99 {stats['p99_ms']:9.2f} ms | "
+          f"{stats['docs_per_sec']:8.2f} docs/s | alloc {stats['peak_alloc_kb']:10.1f} KB | rss {rss}")
+
+
+def gate_metric(key, stats, previous):
+    """Use p95 only when both runs had enough samples for it to differ from the max"""
+    if key.startswith(COLD_START_PREFIX):
+        # Interpreter launches are noisy on shared machines; the median is the stable signal
+        return 'p50_ms'
+    samples = min(stats['iterations'], previous['iterations'])
+    return 'p95_ms' if samples >= MIN_P95_SAMPLES else 'p50_ms'
+
+
+def compare_to_baseline(results, baseline, tolerance, min_delta_ms, min_delta_kb, cold_start_min_delta_ms):
+    """Return a list of regressions where latency, throughput or memory got worse than tolerance allows
+
+    A change only counts when it is beyond the relative tolerance and at least
+    min_delta_ms (or min_delta_kb for memory, cold_start_min_delta_ms for
+    cold start) in absolute terms, so sub-millisecond operations do not fail
+    on timer jitter. Values are compared at the 0.01 ms precision they print at.
+    """
+    # Never flag a difference smaller than the printed precision
+    min_delta_ms = max(min_delta_ms, 0.01)
+    cold_start_min_delta_ms = max(cold_start_min_delta_ms, 0.01)
+    regressions = []
+    for key, stats in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+
+        metric = gate_metric(key, stats, previous)
+        floor = cold_start_min_delta_ms if key.startswith(COLD_START_PREFIX) else min_delta_ms
+        old, new = round(previous[metric], 2), round(stats[metric], 2)
+        if new > old * (1 + tolerance) and new - old >= floor - 1e-9:
+            regressions.append(f"{key}: {metric[:-3]} {old:.2f} ms -> {new:.2f} ms")
+
+        if previous.get('docs_per_sec') and stats.get('docs_per_sec'):
+            # Throughput is gated on the equivalent mean latency so the same floor applies
+            old_mean = round(1000 / previous['docs_per_sec'], 2)
+            new_mean = round(1000 / stats['docs_per_sec'], 2)
+            if (stats['docs_per_sec'] < previous['docs_per_sec'] * (1 - tolerance)
+                    and new_mean - old_mean >= min_delta_ms - 1e-9):
+                regressions.append(f"{key}: throughput {previous['docs_per_sec']:.2f} -> "
+                                   f"{stats['docs_per_sec']:.2f} docs/s (mean {old_mean:.2f} ms -> {new_mean:.2f} ms)")
+
+        for metric in MEMORY_METRICS:
+            if previous.get(metric) is None or stats.get(metric) is None:
+                continue
+            if stats[metric] > previous[metric] * (1 + tolerance) and stats[metric] - previous[metric] >= min_delta_kb:
+                regressions.append(f"{key}: {metric} {previous[metric]:.1f} KB -> {stats[metric]:.1f} KB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the analysis and drafting agents')
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES,
+                        help='Synthetic contract sizes, e.g. 1KB 100KB 5MB')
+    parser.add_argument('--iterations', type=positive_int, default=MIN_P95_SAMPLES,
+                        help=f'Runs per operation and size; p95 is gated only with at least {MIN_P95_SAMPLES}, '
+                             'otherwise p50')
+    parser.add_argument('--cold-start-runs', type=non_negative_int, default=10,
+                        help='Fresh interpreters used to time import and construction (0 to skip); gated on p50')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='Baseline JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown before a result counts as a regression (0.25 = 25%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0,
+                        help='Smallest absolute slowdown in ms that can count as a regression')
+    parser.add_argument('--cold-start-min-delta-ms', type=float, default=50.0,
+                        help='Smallest absolute cold-start slowdown in ms that can count as a regression')
+    parser.add_argument('--min-delta-kb', type=float, default=1024,
+                        help='Smallest absolute memory growth in KB that can count as a regression')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Merge these results into the baseline instead of comparing')
+    parser.add_argument('--allow-missing-baseline', action='store_true',
+                        help='Exit 0 instead of failing when the baseline file does not exist')
+    parser.add_argument('--output', help='Also write the raw results to this JSON file')
+    args = parser.parse_args()
+
+    print("⏱️  Benchmarking Analysis and Drafting Agents")
+    print("=" * 60)
+
+    results = {}
+    if args.cold_start_runs > 0:
+        results.update(measure_cold_start(args.cold_start_runs))
+    results.update(asyncio.run(run_benchmarks(args.sizes, args.iterations)))
+
+    peak_rss = process_peak_rss_kb()
+    if peak_rss is not None:
+        print(f"\n📈 Process peak RSS: {peak_rss / 1024:.1f} MB")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.update_baseline:
+        # Merge so a partial run (e.g. --sizes 1KB) keeps the other stored entries
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\n💾 Baseline updated with {len(results)} entries in {args.baseline}")
+        return 0
+
+    if not baseline:
+        if args.allow_missing_baseline:
+            print(f"\n⚠️  No baseline at {args.baseline}; nothing was checked")
+            return 0
+        print(f"\n❌ No baseline at {args.baseline}; run with --update-baseline to create one "
+              f"or pass --allow-missing-baseline")
+        return 1
+
+    regressions = compare_to_baseline(results, baseline, args.tolerance, args.min_delta_ms, args.min_delta_kb,
+                                      args.cold_start_min_delta_ms)
+    not_run = sorted(set(baseline) - set(results))
+    if not_run:
+        print(f"\n⚠️  {len(not_run)} baseline entries were not measured in this run and were not checked:")
+        for key in not_run:
+            print(f"   • {key}")
+
+    limits = (f"{args.tolerance:.0%} tolerance (floors {args.min_delta_ms:g} ms, "
+              f"{args.cold_start_min_delta_ms:g} ms cold start, {args.min_delta_kb:g} KB)")
+    print("\n🚦 Baseline Comparison")
+    print("=" * 60)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) beyond {limits}:")
+        for regression in regressions:
+            print(f"   • {regression}")
+        return 1
+
+    print(f"✅ No regressions beyond {limits}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())